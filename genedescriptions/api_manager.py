@@ -4,8 +4,19 @@ import os
 import ssl
 import urllib.request
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+TEXTPRESSO_MAX_WORKERS = 16
+
 logger = logging.getLogger(__name__)
 
+if not os.environ.get('PYTHONHTTPSVERIFY', '') and getattr(ssl, '_create_unverified_context', None):
+    _ssl_context = ssl._create_unverified_context()
+else:
+    _ssl_context = ssl.create_default_context()
+_url_opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_ssl_context))
+
 
 class APIManager(object):
     def __init__(self, textpresso_api_token):
@@ -13,8 +24,6 @@ class APIManager(object):
         self.tpc_cache = {}
         self.class_cache = {}
         self.tpc_api_endpoint = "https://textpressocentral.org:18080/v1/textpresso/api/get_documents_count"
-        if not os.environ.get('PYTHONHTTPSVERIFY', '') and getattr(ssl, '_create_unverified_context', None):
-            ssl._create_default_https_context = ssl._create_unverified_context
 
     def get_textpresso_popularity(self, keyword: str):
         """get the number of papers in the C. elegans literature that mention a certain keyword from Textpresso Central API
@@ -33,12 +42,27 @@ class APIManager(object):
             data = data.encode('utf-8')
             req = urllib.request.Request(self.tpc_api_endpoint, data, headers={'Content-type': 'application/json',
                                                                                'Accept': 'application/json'})
-            res = urllib.request.urlopen(req)
+            res = _url_opener.open(req)
             logger.debug("Sending request to Textpresso Central API")
             popularity = int(json.loads(res.read().decode('utf-8')))
             self.tpc_cache[keyword] = popularity
             return popularity
 
+    def get_textpresso_popularities(self, keywords: List[str]) -> List[int]:
+        """get the popularity of multiple keywords from Textpresso Central API, sending the requests for keywords that
+        are not in cache in parallel
+
+        Args:
+            keywords (List[str]): the keywords to search
+        Returns:
+            List[int]: the popularity of each keyword, in the same order as the keywords
+        """
+        keywords_to_fetch = {keyword for keyword in keywords if keyword not in self.tpc_cache}
+        if keywords_to_fetch:
+            with ThreadPoolExecutor(max_workers=min(TEXTPRESSO_MAX_WORKERS, len(keywords_to_fetch))) as executor:
+                list(executor.map(self.get_textpresso_popularity, keywords_to_fetch))
+        return [self.tpc_cache[keyword] for keyword in keywords]
+
     def get_gene_class(self, gene_id: str):
         """get the gene class of a gene from WormBase API
 
@@ -48,19 +72,19 @@ class APIManager(object):
             str: the class of the gene
         """
         if gene_id in self.class_cache:
-            logger.debug("Gene class for gene " + gene_id + " found in cache")
+            logger.debug("Gene class for gene %s found in cache", gene_id)
             return self.class_cache[gene_id]
         else:
             try:
-                logger.debug("Getting gene class for gene " + gene_id)
-                gene_class_data = json.loads(urllib.request.urlopen("http://rest.wormbase.org/rest/field/gene/" +
-                                                                    gene_id + "/gene_class").read())
+                logger.debug("Getting gene class for gene %s", gene_id)
+                gene_class_data = json.loads(_url_opener.open("http://rest.wormbase.org/rest/field/gene/" + gene_id +
+                                                              "/gene_class").read())
+                result = None
                 if "gene_class" in gene_class_data and gene_class_data["gene_class"]["data"] and "tag" in \
                         gene_class_data["gene_class"]["data"] and "label" in \
                         gene_class_data["gene_class"]["data"]["tag"]:
                     result = gene_class_data["gene_class"]["data"]["tag"]["label"]
-                    self.class_cache[gene_id] = result
-                    return result
+                self.class_cache[gene_id] = result
+                return result
             except:
                 return None
-            return None
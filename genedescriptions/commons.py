@@ -1,3 +1,5 @@
+import inflect
+
 from collections import namedtuple
 from enum import Enum
 from typing import Set, List, Any
@@ -22,6 +24,9 @@ class Sentence:
 
 Gene = namedtuple('Gene', ['id', 'name', 'dead', 'pseudo'])
 
+# shared by all modules, since building an inflect engine is expensive
+inflect_engine = inflect.engine()
+
 
 class DataType(Enum):
     GO = 1
@@ -83,3 +88,22 @@ class TrimmingResult:
     partial_coverage: bool = False
     multicovering_nodes: Set[str] = field(default_factory=set)
     covered_nodes: Set[str] = field(default_factory=set)
+
+
+class cached_property(object):
+    """decorator that turns a method into an attribute computed on first access, like functools.cached_property,
+    which is only available from Python 3.8
+
+    The computed value is stored in the instance dictionary under the name of the method, so later reads do not go
+    through the descriptor and the attribute can be re-assigned like a plain one
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.func.__name__] = self.func(instance)
+        return value
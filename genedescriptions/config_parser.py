@@ -28,6 +28,34 @@ class ConfigModuleProperty(Enum):
     REMAP_TERMS = 17
 
 
+_MODULE_NAMES = {
+    Module.GO: "go_sentences_options",
+    Module.DO_EXPERIMENTAL: "do_exp_sentences_options",
+    Module.DO_BIOMARKER: "do_biomarker_sentences_options",
+    Module.DO_ORTHOLOGY: "do_via_orth_sentences_options",
+    Module.EXPRESSION: "expression_sentences_options"
+}
+
+_MODULE_PROPERTY_NAMES = {
+    ConfigModuleProperty.RENAME_TERMS: "rename_terms",
+    ConfigModuleProperty.EXCLUDE_TERMS: "exclude_terms",
+    ConfigModuleProperty.DEL_PARENTS_IF_CHILD: "remove_parents_if_children_are_present",
+    ConfigModuleProperty.DEL_CHILDREN_IF_PARENT: "remove_children_if_parent_is_present",
+    ConfigModuleProperty.APPLY_TRIMMING: "trim_terms_by_common_ancestors",
+    ConfigModuleProperty.MAX_NUM_TERMS_IN_SENTENCE: "max_num_terms",
+    ConfigModuleProperty.DISTANCE_FROM_ROOT: "trim_min_distance_from_root",
+    ConfigModuleProperty.CUTOFF_SEVERAL_WORD: "truncate_others_aggregation_word",
+    ConfigModuleProperty.CUTOFF_SEVERAL_CATEGORY_WORD: "truncate_others_terms",
+    ConfigModuleProperty.ADD_MULTIPLE_TO_COMMON_ANCEST: "add_multiple_if_covers_more_children",
+    ConfigModuleProperty.RENAME_CELL: "rename_cell",
+    ConfigModuleProperty.REMOVE_OVERLAP: "remove_overlapped_terms",
+    ConfigModuleProperty.TRIMMING_ALGORITHM: "trimming_algorithm",
+    ConfigModuleProperty.SLIM_URL: "slim_url",
+    ConfigModuleProperty.SLIM_BONUS_PERC: "slim_bonus_perc",
+    ConfigModuleProperty.REMAP_TERMS: "remap_terms"
+}
+
+
 class GenedescConfigParser(object):
     def __init__(self, file_path):
         with open(file_path) as conf_file:
@@ -56,55 +84,11 @@ class GenedescConfigParser(object):
 
     @staticmethod
     def _get_module_name(module: Module):
-        module_name = ""
-        if module == Module.GO:
-            module_name = "go_sentences_options"
-        elif module == Module.DO_EXPERIMENTAL:
-            module_name = "do_exp_sentences_options"
-        elif module == Module.DO_BIOMARKER:
-            module_name = "do_biomarker_sentences_options"
-        elif module == Module.DO_ORTHOLOGY:
-            module_name = "do_via_orth_sentences_options"
-        elif module == Module.EXPRESSION:
-            module_name = "expression_sentences_options"
-        return module_name
+        return _MODULE_NAMES.get(module, "")
 
     @staticmethod
     def _get_module_property_name(prop: ConfigModuleProperty):
-        property_name = ""
-        if prop == ConfigModuleProperty.RENAME_TERMS:
-            property_name = "rename_terms"
-        if prop == ConfigModuleProperty.EXCLUDE_TERMS:
-            property_name = "exclude_terms"
-        elif prop == ConfigModuleProperty.DEL_PARENTS_IF_CHILD:
-            property_name = "remove_parents_if_children_are_present"
-        elif prop == ConfigModuleProperty.DEL_CHILDREN_IF_PARENT:
-            property_name = "remove_children_if_parent_is_present"
-        elif prop == ConfigModuleProperty.APPLY_TRIMMING:
-            property_name = "trim_terms_by_common_ancestors"
-        elif prop == ConfigModuleProperty.MAX_NUM_TERMS_IN_SENTENCE:
-            property_name = "max_num_terms"
-        elif prop == ConfigModuleProperty.DISTANCE_FROM_ROOT:
-            property_name = "trim_min_distance_from_root"
-        elif prop == ConfigModuleProperty.CUTOFF_SEVERAL_WORD:
-            property_name = "truncate_others_aggregation_word"
-        elif prop == ConfigModuleProperty.CUTOFF_SEVERAL_CATEGORY_WORD:
-            property_name = "truncate_others_terms"
-        elif prop == ConfigModuleProperty.ADD_MULTIPLE_TO_COMMON_ANCEST:
-            property_name = "add_multiple_if_covers_more_children"
-        elif prop == ConfigModuleProperty.RENAME_CELL:
-            property_name = "rename_cell"
-        elif prop == ConfigModuleProperty.REMOVE_OVERLAP:
-            property_name = "remove_overlapped_terms"
-        elif prop == ConfigModuleProperty.TRIMMING_ALGORITHM:
-            property_name = "trimming_algorithm"
-        elif prop == ConfigModuleProperty.SLIM_URL:
-            property_name = "slim_url"
-        elif prop == ConfigModuleProperty.SLIM_BONUS_PERC:
-            property_name = "slim_bonus_perc"
-        elif prop == ConfigModuleProperty.REMAP_TERMS:
-            property_name = "remap_terms"
-        return property_name
+        return _MODULE_PROPERTY_NAMES.get(prop, "")
 
     def get_prepostfix_sentence_map(self, module: Module, special_cases_only: bool = False, humans: bool = False):
         module_name = self._get_module_name(module)
@@ -1,22 +1,34 @@
-import gzip
+import io
 import logging
+import urllib.error
 import urllib.request
 import shutil
 import os
+import pickle
 import re
-import inflect
+import urllib3
 
 from enum import Enum
-from collections import defaultdict
-from typing import List, Iterable, Dict
+from functools import lru_cache
+from typing import List, Iterable, Dict, Tuple
 from ontobio import AssociationSetFactory
 from ontobio.ontol_factory import OntologyFactory
 from ontobio.ontol import Ontology
 from ontobio.assocmodel import AssociationSet
-from genedescriptions.commons import Gene, DataType, Module, get_module_from_data_type
+from ontobio.io.gafparser import GafParser
+from genedescriptions.commons import Gene, DataType, Module, get_module_from_data_type, inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser, ConfigModuleProperty
 from genedescriptions.ontology_tools import set_all_depths, set_ic_annot_freq, set_ic_ontology_struct
 
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+
+READ_BUFFER_SIZE = 128 * 1024
+PARSED_CACHE_VERSION = 3
+
 
 class ExpressionClusterType(Enum):
     ANATOMY = 1
@@ -31,6 +43,40 @@ class ExpressionClusterFeature(Enum):
 
 logger = logging.getLogger(__name__)
 
+_http_pool = urllib3.PoolManager()
+
+
+@lru_cache(maxsize=None)
+def _is_singular_noun(word: str) -> bool:
+    """check whether a word is not the plural form of a noun"""
+    return inflect_engine.singular_noun(word) is False
+
+
+@lru_cache(maxsize=None)
+def _get_priority_map(priority_list: Tuple[str, ...]) -> Dict[str, int]:
+    """map evidence codes to their priority, where the first code in the list has the highest value"""
+    return dict(zip(priority_list, reversed(range(len(priority_list)))))
+
+
+def _download_file(file_source_url: str, cache_path: str) -> None:
+    """download a remote file, re-using pooled keep-alive connections for http and https sources
+
+    Args:
+        file_source_url (str): url of the file to download
+        cache_path (str): local path where to save the file
+    """
+    if not file_source_url.startswith(("http://", "https://")):
+        urllib.request.urlretrieve(file_source_url, cache_path)
+        return
+    response = _http_pool.request("GET", file_source_url, preload_content=False, decode_content=False)
+    try:
+        if response.status >= 400:
+            raise urllib.error.HTTPError(file_source_url, response.status, response.reason, response.headers, None)
+        with open(cache_path, 'wb') as f_out:
+            shutil.copyfileobj(response, f_out, READ_BUFFER_SIZE)
+    finally:
+        response.release_conn()
+
 
 class DataManager(object):
     """retrieve data for gene descriptions from different sources"""
@@ -59,6 +105,7 @@ class DataManager(object):
         self.do_slim = set()
         self.exp_slim = set()
         self.use_cache = use_cache
+        self.fetched_cache_paths = set()
 
     def get_ontology(self, data_type: DataType):
         if data_type == DataType.DO:
@@ -98,19 +145,68 @@ class DataManager(object):
             slim_name = "expr_slim.obo"
         return os.path.join(os.path.dirname(os.path.normpath(ontology_cache_path)), slim_name)
 
-    def _get_cached_file(self, cache_path: str, file_source_url):
+    def _fetch_file(self, cache_path: str, file_source_url):
+        """download a file to its cache location, unless it is already cached and the cache can be used or it has
+        already been downloaded by this data manager
+
+        Args:
+            cache_path (str): path to the cache file
+            file_source_url (str): url to the remote file
+        """
         if not os.path.isfile(cache_path):
             os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            urllib.request.urlretrieve(file_source_url, cache_path)
-        elif not self.use_cache:
-            urllib.request.urlretrieve(file_source_url, cache_path)
+            _download_file(file_source_url, cache_path)
+        elif not self.use_cache and cache_path not in self.fetched_cache_paths:
+            _download_file(file_source_url, cache_path)
+        self.fetched_cache_paths.add(cache_path)
+
+    def _get_cached_file(self, cache_path: str, file_source_url):
+        self._fetch_file(cache_path=cache_path, file_source_url=file_source_url)
         file_path = cache_path
         if cache_path.endswith(".gz"):
-            with gzip.open(cache_path, 'rb') as f_in, open(cache_path.replace(".gz", ""), 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
             file_path = cache_path.replace(".gz", "")
+            if not os.path.isfile(file_path) or os.path.getmtime(file_path) < os.path.getmtime(cache_path):
+                # inflate into a temporary file of this process, so that runs sharing the cache never read or replace
+                # a partially written copy
+                tmp_file_path = file_path + "." + str(os.getpid()) + ".tmp"
+                with gzip.open(cache_path, 'rb') as f_in, open(tmp_file_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out, READ_BUFFER_SIZE)
+                os.replace(tmp_file_path, file_path)
         return file_path
 
+    def _load_or_parse(self, cache_path: str, parse_fn):
+        """return the parsed content of a cached file, re-using a pickled copy of a previous parse if it is newer than
+        the cached file
+
+        The pickled copy is keyed on the raw file only, so a raw file must always be parsed by the same function.
+        Unreadable pickles are logged and the raw file is parsed again
+
+        Args:
+            cache_path (str): path to the cached raw file
+            parse_fn: function without arguments that parses the raw file
+        Returns:
+            the result of parse_fn
+        """
+        if not self.use_cache:
+            return parse_fn()
+        parsed_cache_path = cache_path + ".v" + str(PARSED_CACHE_VERSION) + ".pkl"
+        if os.path.isfile(parsed_cache_path) and os.path.getmtime(parsed_cache_path) >= os.path.getmtime(cache_path):
+            logger.debug("Loading parsed data from %s", parsed_cache_path)
+            try:
+                with open(parsed_cache_path, 'rb') as parsed_file:
+                    return pickle.load(parsed_file)
+            except Exception as e:
+                logger.warning("Cannot load parsed data from %s (%s), parsing %s again", parsed_cache_path, e,
+                               cache_path)
+        parsed_data = parse_fn()
+        # write to a temporary file of this process first, so that an interrupted run or runs writing at the same time
+        # never leave a truncated pickle
+        tmp_parsed_cache_path = parsed_cache_path + "." + str(os.getpid()) + ".tmp"
+        with open(tmp_parsed_cache_path, 'wb') as parsed_file:
+            pickle.dump(parsed_data, parsed_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_parsed_cache_path, parsed_cache_path)
+        return parsed_data
+
     def get_gene_data(self, include_dead_genes: bool = False, include_pseudo_genes: bool = False) -> Gene:
         """get all gene data from the fetcher, returning one gene per call
 
@@ -162,8 +258,8 @@ class DataManager(object):
         if terms_replacement_regex:
             for regex_to_substitute, regex_target in terms_replacement_regex.items():
                 for node in ontology.search(regex_to_substitute, is_regex=True):
-                    ontology.node(node)["label"] = re.sub(regex_to_substitute, regex_target,
-                                                          ontology.node(node)["label"])
+                    node_props = ontology.node(node)
+                    node_props["label"] = re.sub(regex_to_substitute, regex_target, node_props["label"])
 
     def set_ontology(self, ontology_type: DataType, ontology: Ontology, config: GenedescConfigParser,
                      slim_cache_path: str = None) -> None:
@@ -208,11 +304,10 @@ class DataManager(object):
 
     @staticmethod
     def add_article_to_nodes(ontology):
-        inflect_engine = inflect.engine()
         for term in ontology.nodes():
-            if "label" in ontology.node(term) and \
-                    inflect_engine.singular_noun(ontology.node(term)["label"].split(" ")[-1]) is False:
-                ontology.node(term)["label"] = "the " + ontology.node(term)["label"]
+            term_props = ontology.node(term)
+            if "label" in term_props and _is_singular_noun(term_props["label"].split(" ")[-1]):
+                term_props["label"] = "the " + term_props["label"]
 
     def load_ontology_from_file(self, ontology_type: DataType, ontology_url: str, ontology_cache_path: str,
                                 config: GenedescConfigParser) -> None:
@@ -224,8 +319,9 @@ class DataManager(object):
             ontology_cache_path (str): path to cache file for the ontology
             config (GenedescConfigParser): configuration object where to read properties
         """
-        new_ontology = OntologyFactory().create(self._get_cached_file(file_source_url=ontology_url,
-                                                                      cache_path=ontology_cache_path))
+        file_path = self._get_cached_file(file_source_url=ontology_url, cache_path=ontology_cache_path)
+        new_ontology = self._load_or_parse(cache_path=ontology_cache_path,
+                                           parse_fn=lambda: OntologyFactory().create(file_path))
         self.set_ontology(ontology_type=ontology_type, ontology=new_ontology, config=config,
                           slim_cache_path=self.get_slim_cache_path(ontology_cache_path, ontology_type))
 
@@ -312,9 +408,11 @@ class DataManager(object):
             associations_cache_path (str): path to cache file for the associations
             config (GenedescConfigParser): configuration object where to read properties
         """
-        assocs = AssociationSetFactory().create_from_file(file=self._get_cached_file(
-            cache_path=associations_cache_path, file_source_url=associations_url),
-            ontology=self.get_ontology(associations_type), skim=False)
+        file_path = self._get_cached_file(cache_path=associations_cache_path, file_source_url=associations_url)
+        assocs = AssociationSetFactory().create_from_assocs(
+            assocs=self._load_or_parse(cache_path=associations_cache_path,
+                                       parse_fn=lambda: GafParser().parse(file_path, skipheader=True)),
+            ontology=self.get_ontology(associations_type))
         self.set_associations(associations_type=associations_type, associations=assocs, config=config)
 
     def get_annotations_for_gene(self, gene_id: str, annot_type: DataType = DataType.GO,
@@ -353,24 +451,22 @@ class DataManager(object):
             dataset = self.expression_associations
             ontology = self.expression_ontology
         if dataset is not None and ontology is not None:
-            priority_map = dict(zip(priority_list, reversed(range(len(list(priority_list))))))
-            annotations = [annotation for annotation in dataset.associations(gene_id) if
-                           ontology.has_node(annotation["object"]["id"]) and (
-                               include_obsolete or ("deprecated" not in ontology.node(annotation["object"]["id"]) or
-                                                    not ontology.node(annotation["object"]["id"])["deprecated"]))
-                           and (include_negative_results or ("NOT" not in annotation["qualifiers"] and
-                                                             not annotation["negated"]))
-                           and ontology.label(annotation["object"]["id"])]
+            gene_associations = dataset.associations(gene_id)
+            if not gene_associations:
+                return []
+            priority_map = _get_priority_map(tuple(priority_list))
             id_selected_annotation = {}
-            for annotation in annotations:
-                if annotation["evidence"]["type"] in priority_map.keys():
-                    if annotation["object"]["id"] in id_selected_annotation:
-                        if priority_map[annotation["evidence"]["type"]] > \
-                                priority_map[id_selected_annotation[annotation["object"]["id"]]["evidence"]["type"]]:
-                            id_selected_annotation[annotation["object"]["id"]] = annotation
-                    else:
-                        id_selected_annotation[annotation["object"]["id"]] = annotation
-            return [annotation for annotation in id_selected_annotation.values()]
+            for annotation in gene_associations:
+                term_id = annotation["object"]["id"]
+                priority = priority_map.get(annotation["evidence"]["type"])
+                if priority is not None and ontology.has_node(term_id) and (
+                        include_obsolete or not ontology.node(term_id).get("deprecated", False)) and (
+                        include_negative_results or ("NOT" not in annotation["qualifiers"] and
+                                                     not annotation["negated"])) and ontology.label(term_id):
+                    if term_id not in id_selected_annotation or \
+                            priority > priority_map[id_selected_annotation[term_id]["evidence"]["type"]]:
+                        id_selected_annotation[term_id] = annotation
+            return list(id_selected_annotation.values())
         else:
             return []
 
@@ -389,16 +485,18 @@ class DataManager(object):
             Dict[str, List[str]]: a dictionary of all human genes properties, indexed by HGNC ID
 
         """
-        human_genes_props = defaultdict(list)
-        human_content_w_ensmbl = urllib.request.urlopen("https://www.genenames.org/cgi-bin/download/custom?col=gd_hgnc_id&col=gd_pub_ensembl_id&col=gd_app_sym&col=gd_app_name&status=Approved&status=Entry%20Withdrawn&hgnc_dbtag=on&order_by=gd_app_sym_sort&format=text&submit=submit")
+        human_genes_props = {}
+        human_content_w_ensmbl = io.BufferedReader(urllib.request.urlopen("https://www.genenames.org/cgi-bin/download/custom?col=gd_hgnc_id&col=gd_pub_ensembl_id&col=gd_app_sym&col=gd_app_name&status=Approved&status=Entry%20Withdrawn&hgnc_dbtag=on&order_by=gd_app_sym_sort&format=text&submit=submit"),
+                                                    buffer_size=READ_BUFFER_SIZE)
 
         header = True
         for line in human_content_w_ensmbl:
             if not header:
-                linearr = line.decode("utf-8").split("\t")
+                linearr = line.split(b"\t")
                 linearr[-1] = linearr[-1].strip()
-                if linearr[1] != "":
-                    human_genes_props[linearr[0]] = [linearr[2], linearr[3]]
+                if linearr[1] != b"":
+                    human_genes_props[linearr[0].decode("utf-8")] = [linearr[2].decode("utf-8"),
+                                                                     linearr[3].decode("utf-8")]
             else:
                 header = False
         return human_genes_props
@@ -406,17 +504,17 @@ class DataManager(object):
     @staticmethod
     def get_ensembl_hgnc_ids_map():
         human_genes_props = {}
-        human_content_w_ensmbl = urllib.request.urlopen("https://www.genenames.org/cgi-bin/download?col=gd_hgnc_id&col="
-                                                        "gd_pub_ensembl_id&status=Approved&status=Entry+Withdrawn&statu"
-                                                        "s_opt=2&where=&order_by=gd_app_sym_sort&format=text&limit=&hgn"
-                                                        "c_dbtag=on&submit=submit")
+        human_content_w_ensmbl = io.BufferedReader(urllib.request.urlopen(
+            "https://www.genenames.org/cgi-bin/download?col=gd_hgnc_id&col=gd_pub_ensembl_id&status=Approved&status="
+            "Entry+Withdrawn&status_opt=2&where=&order_by=gd_app_sym_sort&format=text&limit=&hgnc_dbtag=on&submit="
+            "submit"), buffer_size=READ_BUFFER_SIZE)
         header = True
         for line in human_content_w_ensmbl:
             if not header:
-                linearr = line.decode("utf-8").split("\t")
+                linearr = line.split(b"\t")
                 linearr[-1] = linearr[-1].strip()
-                if linearr[1] != "":
-                    human_genes_props[linearr[1]] = linearr[0]
+                if linearr[1] != b"":
+                    human_genes_props[linearr[1].decode("utf-8")] = linearr[0].decode("utf-8")
             else:
                 header = False
         return human_genes_props
@@ -1,9 +1,9 @@
 from typing import Set
 
-import inflect
 import re
 
-from genedescriptions.commons import Sentence, Module, DataType, TrimmingResult, get_data_type_from_module
+from genedescriptions.commons import Sentence, Module, DataType, TrimmingResult, get_data_type_from_module, \
+    inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser, ConfigModuleProperty
 from genedescriptions.data_manager import DataManager
 from genedescriptions.ontology_tools import *
@@ -202,7 +202,7 @@ class OntologySentenceGenerator(object):
         if len(terms_nochildren) < len(terms):
             if terms_already_covered is not None:
                 terms_already_covered.update(set(terms) - set(terms_nochildren))
-            logger.debug("Removed " + str(len(terms) - len(terms_nochildren)) + " children from terms")
+            logger.debug("Removed %d children from terms", len(terms) - len(terms_nochildren))
             return terms_nochildren
         else:
             return terms
@@ -214,7 +214,7 @@ class OntologySentenceGenerator(object):
         if len(terms) > len(terms_no_ancestors):
             if terms_already_covered is not None:
                 terms_already_covered.update(set(terms) - set(terms_no_ancestors))
-            logger.debug("Removed " + str(len(terms) - len(terms_no_ancestors)) + " parents from terms")
+            logger.debug("Removed %d parents from terms", len(terms) - len(terms_no_ancestors))
             return terms_no_ancestors
         else:
             return terms
@@ -257,8 +257,8 @@ class OntologySentenceGenerator(object):
                 terms_no_ancestors = sent_merger.terms_ids - set([ancestor for node_id in sent_merger.terms_ids for
                                                                   ancestor in self.ontology.ancestors(node_id)])
                 if len(sent_merger.terms_ids) > len(terms_no_ancestors):
-                    logger.debug("Removed " + str(len(sent_merger.terms_ids) - len(terms_no_ancestors)) +
-                                 " parents from terms while merging sentences with same prefix")
+                    logger.debug("Removed %d parents from terms while merging sentences with same prefix",
+                                 len(sent_merger.terms_ids) - len(terms_no_ancestors))
                     sent_merger.terms_ids = terms_no_ancestors
         return [Sentence(prefix=prefix, initial_terms_ids=list(sent_merger.initial_terms_ids),
                          terms_ids=list(sent_merger.terms_ids),
@@ -290,7 +290,6 @@ class OntologySentenceGenerator(object):
         postfix_phrases = [postfix for postfix in postfix_phrases if postfix]
         if postfix_phrases and len(postfix_phrases) > 0:
             if len(postfix_phrases) > 1:
-                inf_engine = inflect.engine()
                 shortest_phrase = sorted(zip(postfix_phrases, [len(phrase) for phrase in postfix_phrases]),
                                          key=lambda x: x[1])[0][0]
                 first_part = ""
@@ -308,7 +307,7 @@ class OntologySentenceGenerator(object):
                         break
                 new_phrases = [phrase.replace(first_part, "").replace(last_part, "") for phrase in postfix_phrases]
                 if len(last_part.strip().split(" ")) == 1:
-                    last_part = inf_engine.plural(last_part)
+                    last_part = inflect_engine.plural(last_part)
                 if len(new_phrases) > 2:
                     return first_part + ", ".join(new_phrases[0:-1]) + ", and " + new_phrases[-1] + last_part
                 elif len(new_phrases) > 1:
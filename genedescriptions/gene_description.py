@@ -1,8 +1,6 @@
-import inflect
-
 from typing import List
 
-from genedescriptions.commons import Module, Sentence
+from genedescriptions.commons import Module, Sentence, inflect_engine
 from genedescriptions.config_parser import GenedescConfigParser
 from genedescriptions.descriptions_generator import OntologySentenceGenerator, ModuleSentences
 from genedescriptions.sentence_generation_functions import concatenate_words_with_oxford_comma
@@ -88,7 +86,6 @@ class GeneDescription(object):
             desc = module_sentences.get_description()
             self.stats.trimmed = self.stats.trimmed or any([sent.trimmed for sent in module_sentences.sentences])
         elif description:
-            inflect_engine = inflect.engine()
             desc = description
             if additional_postfix_terms_list and len(additional_postfix_terms_list) > 0:
                 desc += " " + concatenate_words_with_oxford_comma(additional_postfix_terms_list,
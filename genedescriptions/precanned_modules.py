@@ -213,13 +213,19 @@ def generate_ortholog_sentence_wormbase_human(orthologs: List[List[str]], human_
     if len(orthologs) > 3:
         orthologs = orthologs[0:3]
         prefix = "several human genes including "
-    symbol_name_arr = sorted([human_genes_props[best_orth[0]][0] + " (" + human_genes_props[best_orth[0]][1] +
-                              ")" if best_orth[0] in human_genes_props and human_genes_props[best_orth[0]] else
-                              best_orth[1] for best_orth in orthologs])
+    symbol_name_arr = []
+    selected_symbols = []
+    for best_orth in orthologs:
+        gene_props = human_genes_props.get(best_orth[0])
+        if gene_props:
+            symbol_name_arr.append(gene_props[0] + " (" + gene_props[1] + ")")
+            selected_symbols.append(gene_props[0])
+        else:
+            symbol_name_arr.append(best_orth[1])
+    symbol_name_arr.sort()
     orth_sentence = "is an ortholog of " + prefix + concatenate_words_with_oxford_comma(
         symbol_name_arr, separator=config.get_terms_delimiter())
-    return [human_genes_props[best_orth[0]][0] for best_orth in orthologs if best_orth[0] in human_genes_props and
-            human_genes_props[best_orth[0]]], orth_sentence
+    return selected_symbols, orth_sentence
 
 
 def generate_ortholog_sentence_wormbase_non_c_elegans(orthologs: List[List[str]], orthologs_sp_fullname: str,
@@ -242,8 +248,9 @@ def generate_ortholog_sentence_wormbase_non_c_elegans(orthologs: List[List[str]]
             orthologs_sp_fullname = " ".join(fullname_arr)
         if len(orthologs) > 3:
             # sort orthologs by tpc popularity and alphabetically (if tied)
-            orthologs_pop = [o_p for o_p in sorted([[ortholog, api_manager.get_textpresso_popularity(ortholog[1])] for
-                                                    ortholog in orthologs], key=lambda x: (x[1], x[0][1]),
+            popularities = api_manager.get_textpresso_popularities([ortholog[1] for ortholog in orthologs])
+            orthologs_pop = [o_p for o_p in sorted([[ortholog, popularity] for ortholog, popularity in
+                                                    zip(orthologs, popularities)], key=lambda x: (x[1], x[0][1]),
                                                    reverse=True)]
             classes_orth_pop = defaultdict(list)
             orthologs_pop_wo_class = []
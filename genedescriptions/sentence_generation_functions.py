@@ -8,6 +8,8 @@ from genedescriptions.config_parser import GenedescConfigParser
 
 logger = logging.getLogger(__name__)
 
+_KDA_SUFFIX_REGEX = re.compile(r"[,]? kDa$")
+
 
 def compose_sentence(prefix: str, additional_prefix: str, term_names: List[str], postfix: str,
                      config: GenedescConfigParser, ancestors_with_multiple_children: Set[str] = None,
@@ -108,11 +110,7 @@ def _get_single_sentence(initial_terms_ids: List[str], node_ids: List[str], onto
 
 
 def rename_human_ortholog_name(ortholog_name: str):
-    new_name = ortholog_name
-    if " family member " in ortholog_name:
-        new_name = new_name.replace(" family member ", " ")
-    new_name = re.sub(r"[,]? kDa$", "", new_name)
-    return new_name
+    return _KDA_SUFFIX_REGEX.sub("", ortholog_name.replace(" family member ", " "))
 
 
 def is_human_ortholog_name_valid(ortholog_name: str):
@@ -77,8 +77,8 @@ class TrimmingAlgorithmIC(TrimmingAlgorithm):
             if "IC" in candidate_node:
                 return candidate_node["IC"]
             else:
-                logger.warning(f"Annotation to a possibly obsolete node that doesn't have an IC value: "
-                               f"{candidate.node_id}")
+                logger.warning("Annotation to a possibly obsolete node that doesn't have an IC value: %s",
+                               candidate.node_id)
                 return 0
 
     def trim(self, node_ids: List[str], max_num_nodes: int = 3, min_distance_from_root: int = 0) -> TrimmingResult:
@@ -10,7 +10,6 @@ setup(name='genedescriptions',
       author_email='valearna@caltech.edu',
       packages=['genedescriptions'],
       install_requires=[
-          'namedlist',
           'inflect',
           'PyYAML',
           'numpy',
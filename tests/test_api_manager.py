@@ -0,0 +1,33 @@
+import threading
+import unittest
+
+from genedescriptions.api_manager import APIManager
+
+
+class TestAPIManager(unittest.TestCase):
+
+    def setUp(self):
+        self.api_manager = APIManager(textpresso_api_token="")
+        self.requested_keywords = []
+        lock = threading.Lock()
+
+        def get_textpresso_popularity(keyword: str):
+            with lock:
+                self.requested_keywords.append(keyword)
+            self.api_manager.tpc_cache[keyword] = len(keyword)
+            return len(keyword)
+
+        self.api_manager.get_textpresso_popularity = get_textpresso_popularity
+
+    def test_get_textpresso_popularities(self):
+        keywords = ["dpy-10", "unc-119", "lin-3", "unc-119", "a"]
+        self.assertEqual(self.api_manager.get_textpresso_popularities(keywords), [len(kw) for kw in keywords])
+        self.assertEqual(sorted(self.requested_keywords), sorted(set(keywords)))
+
+    def test_get_textpresso_popularities_cached(self):
+        self.api_manager.tpc_cache["dpy-10"] = 100
+        self.assertEqual(self.api_manager.get_textpresso_popularities(["lin-3", "dpy-10"]), [5, 100])
+        self.assertEqual(self.requested_keywords, ["lin-3"])
+        self.assertEqual(self.api_manager.get_textpresso_popularities(["dpy-10", "lin-3"]), [100, 5])
+        self.assertEqual(self.requested_keywords, ["lin-3"])
+        self.assertEqual(self.api_manager.get_textpresso_popularities([]), [])
@@ -1,6 +1,7 @@
 import logging
 import unittest
 import os
+import shutil
 
 from ontobio import OntologyFactory, AssociationSetFactory
 
@@ -106,3 +107,85 @@ class TestGOModule(unittest.TestCase):
         self.df.set_associations(associations_type=DataType.GO, associations=assocs, config=self.conf_parser)
         self.assertEqual(self.df.go_associations.associations_by_subj["1"][0]["object"]["id"], "GO:0042303")
 
+
+class TestParsedCache(unittest.TestCase):
+
+    def setUp(self):
+        logging.basicConfig(filename=None, level="ERROR", format='%(asctime)s - %(name)s - %(levelname)s: %(message)s')
+        self.this_dir = os.path.split(__file__)[0]
+        self.conf_parser = GenedescConfigParser(os.path.join(self.this_dir, os.path.pardir, "tests", "config_test.yml"))
+        # do not download the GO slim, so that these tests only read local files
+        self.conf_parser.config["go_sentences_options"]["slim_url"] = ""
+        self.parsed_cache_dir = os.path.join(self.this_dir, "cache", "parsed")
+        shutil.rmtree(self.parsed_cache_dir, ignore_errors=True)
+        os.makedirs(self.parsed_cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.parsed_cache_dir, ignore_errors=True)
+
+    def test_load_or_parse(self):
+        df = DataManager(do_relations=None, go_relations=["subClassOf", "BFO:0000050"], use_cache=True)
+        raw_file_path = os.path.join(self.parsed_cache_dir, "raw.txt")
+        with open(raw_file_path, "w") as raw_file:
+            raw_file.write("raw data")
+        parse_calls = []
+
+        def parse_fn():
+            parse_calls.append(1)
+            return {"data": len(parse_calls)}
+
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=parse_fn), {"data": 1})
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=parse_fn), {"data": 1})
+        self.assertEqual(len(parse_calls), 1)
+        raw_file_mtime = os.path.getmtime(raw_file_path) + 10
+        os.utime(raw_file_path, (raw_file_mtime, raw_file_mtime))
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=parse_fn), {"data": 2})
+        self.assertEqual(len(parse_calls), 2)
+        self.assertFalse(any(file_name.endswith(".tmp") for file_name in os.listdir(self.parsed_cache_dir)))
+
+    def test_load_or_parse_truncated_pickle(self):
+        df = DataManager(do_relations=None, go_relations=["subClassOf", "BFO:0000050"], use_cache=True)
+        raw_file_path = os.path.join(self.parsed_cache_dir, "raw.txt")
+        with open(raw_file_path, "w") as raw_file:
+            raw_file.write("raw data")
+        df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: list(range(1000)))
+        parsed_cache_path = [os.path.join(self.parsed_cache_dir, file_name) for file_name in
+                             os.listdir(self.parsed_cache_dir) if file_name.endswith(".pkl")][0]
+        with open(parsed_cache_path, "rb") as parsed_file:
+            parsed_data = parsed_file.read()
+        with open(parsed_cache_path, "wb") as parsed_file:
+            parsed_file.write(parsed_data[0:len(parsed_data) // 2])
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: list(range(1000))),
+                         list(range(1000)))
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: []), list(range(1000)))
+
+    def test_load_or_parse_unloadable_pickle(self):
+        df = DataManager(do_relations=None, go_relations=["subClassOf", "BFO:0000050"], use_cache=True)
+        raw_file_path = os.path.join(self.parsed_cache_dir, "raw.txt")
+        with open(raw_file_path, "w") as raw_file:
+            raw_file.write("raw data")
+        df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: [1])
+        parsed_cache_path = [os.path.join(self.parsed_cache_dir, file_name) for file_name in
+                             os.listdir(self.parsed_cache_dir) if file_name.endswith(".pkl")][0]
+        # a pickle of a class that cannot be imported any more
+        with open(parsed_cache_path, "wb") as parsed_file:
+            parsed_file.write(b"cgenedescriptions.removed_module\nRemovedClass\n)\x81.")
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: [2]), [2])
+        self.assertEqual(df._load_or_parse(cache_path=raw_file_path, parse_fn=lambda: [3]), [2])
+
+    def test_load_parsed_ontology_and_associations(self):
+        parsed_data = []
+        for _ in range(2):
+            df = DataManager(do_relations=None, go_relations=["subClassOf", "BFO:0000050"], use_cache=True)
+            df.load_ontology_from_file(ontology_type=DataType.GO, ontology_url="file://" + os.path.join(
+                self.this_dir, "data", "go_gd_test.obo"), ontology_cache_path=os.path.join(
+                self.parsed_cache_dir, "go_gd_test.obo"), config=self.conf_parser)
+            df.load_associations_from_file(associations_type=DataType.GO, associations_url="file://" + os.path.join(
+                self.this_dir, "data", "gene_association_1.7.wb.partial"), associations_cache_path=os.path.join(
+                self.parsed_cache_dir, "gene_association_1.7.wb.partial"), config=self.conf_parser)
+            parsed_data.append((sorted(df.go_ontology.nodes()), sorted(df.go_ontology.parents("GO:0000075")),
+                                df.get_annotations_for_gene(gene_id="WB:WBGene00000001", annot_type=DataType.GO)))
+        self.assertEqual(len([file_name for file_name in os.listdir(self.parsed_cache_dir) if
+                              file_name.endswith(".pkl")]), 2)
+        self.assertTrue(len(parsed_data[0][2]) > 0)
+        self.assertEqual(parsed_data[0], parsed_data[1])
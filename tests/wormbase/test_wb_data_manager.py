@@ -13,6 +13,15 @@ from wormbase.wb_data_manager import WBDataManager
 logger = logging.getLogger("Gene Ontology Module tests")
 
 
+class SisterSpeciesDataManagerStub(object):
+
+    def __init__(self, num_annotations):
+        self.num_annotations = num_annotations
+
+    def get_annotations_for_gene(self, gene_id, annot_type, priority_list=None):
+        return [None] * self.num_annotations.get(gene_id, 0)
+
+
 class TestGOModule(unittest.TestCase):
 
     def setUp(self):
@@ -84,3 +93,126 @@ class TestGOModule(unittest.TestCase):
         gene_desc.set_or_extend_module_description_and_final_stats(module_sentences=expression_module_sentences,
                                                                    module=Module.EXPRESSION)
         self.assertTrue("is expressed widely" in gene_desc.description)
+
+    def test_parse_orthology_file(self):
+        orthologs = WBDataManager._parse_orthology_file(os.path.join(self.this_dir, "data",
+                                                                     "c_elegans.orthologs_test.txt"))
+        self.assertEqual(orthologs, {
+            "WB:WBGene00000001": {"Caenorhabditis briggsae": [("WBGene00024207", "Cbr-aap-1", 2)],
+                                  "Homo sapiens": [("HGNC:8979", "PIK3R2", 3), ("HGNC:8980", "PIK3R3", 1),
+                                                   ("HGNC:8981", "PIK3R4", 0)]},
+            "WB:WBGene00000002": {"Caenorhabditis elegans": [("PRJNA13758:WBGene00000004", "aat-3", 3)],
+                                  "Homo sapiens": [("HGNC:11063", "SLC7A5", 1)]}})
+
+    def test_parse_do_daf_associations(self):
+        associations = WBDataManager._parse_do_daf_associations(os.path.join(self.this_dir, "data",
+                                                                              "disease_association_test.daf.txt"))
+        self.assertEqual([(association["subject"]["id"], association["object"]["id"], association["evidence"]["type"])
+                          for association in associations], [("WB:WBGene00000001", "DOID:10652", "IMP"),
+                                                             ("WB:WBGene00000002", "DOID:1324", "BMK"),
+                                                             ("WB:WBGene00000004", "DOID:9352", "IMP")])
+        self.assertEqual(associations[0]["evidence"]["has_supporting_reference"], ["WB:WBPaper00000001"])
+
+    def test_parse_expression_cluster_file(self):
+        clusters = WBDataManager._parse_expression_cluster_file(os.path.join(self.this_dir, "data",
+                                                                             "c_elegans.anatomy_ec_test.txt"))
+        self.assertEqual([(gene_id, cluster_data) for _, gene_id, cluster_data in clusters], [
+            ("WBGene00000001", ["aap-1", "Y110A7A.10", ["neurons", "tail neuron"], ["RNAseq", "Tiling array"]]),
+            ("WBGene00000002", ["aat-1", "F27C8.1", ["intestine"], ""])])
+        self.assertTrue(clusters[0][0].startswith("WBGene00000001\taap-1\t"))
+
+    def _set_test_orthologs(self):
+        self.df.orthologs = {
+            "WB:WBGene00000001": {"Homo sapiens": [("HGNC:1", "GENE1", 3)]},
+            "WB:WBGene00000002": {"Homo sapiens": [("HGNC:2", "GENE2", 2), ("HGNC:3", "GENE3", 4),
+                                                   ("HGNC:4", "GENE4", 1)]},
+            "WB:WBGene00000003": {"Homo sapiens": [("HGNC:5", "GENE5", 2), ("HGNC:6", "GENE6", 1),
+                                                   ("HGNC:7", "GENE7", 2)]},
+            "WB:WBGene00000004": {"Homo sapiens": [], "Caenorhabditis briggsae": [("WBGene10000001", "Cbr-gene-1", 1)]},
+            "WB:WBGene00000005": {"Caenorhabditis briggsae": [("WBGene10000002", "Cbr-gene-2", 1),
+                                                              ("WBGene10000003", "Cbr-gene-3", 1),
+                                                              ("WBGene10000004", "Cbr-gene-4", 1)]}}
+
+    def test_get_best_orthologs_for_gene(self):
+        self._set_test_orthologs()
+        species = ["Homo sapiens", "Caenorhabditis briggsae"]
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000001", orth_species_full_name=species),
+                         ([["HGNC:1", "GENE1"]], "Homo sapiens"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000002", orth_species_full_name=species),
+                         ([["HGNC:3", "GENE3"]], "Homo sapiens"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000003", orth_species_full_name=species),
+                         ([["HGNC:5", "GENE5"], ["HGNC:7", "GENE7"]], "Homo sapiens"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000004", orth_species_full_name=species),
+                         ([["WBGene10000001", "Cbr-gene-1"]], "Caenorhabditis briggsae"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000005", orth_species_full_name=species),
+                         ([["WBGene10000002", "Cbr-gene-2"], ["WBGene10000003", "Cbr-gene-3"],
+                           ["WBGene10000004", "Cbr-gene-4"]], "Caenorhabditis briggsae"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene99999999", orth_species_full_name=species),
+                         (None, "Caenorhabditis briggsae"))
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000001", orth_species_full_name=[]),
+                         (None, None))
+
+    def test_get_best_orthologs_for_gene_with_sister_species(self):
+        self._set_test_orthologs()
+        species = ["Caenorhabditis briggsae"]
+        sister_df = SisterSpeciesDataManagerStub({"WBGene10000003": 2, "WBGene10000004": 5})
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000005", orth_species_full_name=species,
+                                                             sister_species_data_fetcher=sister_df),
+                         ([["WBGene10000004", "Cbr-gene-4"]], "Caenorhabditis briggsae"))
+        sister_df = SisterSpeciesDataManagerStub({"WBGene10000003": 2, "WBGene10000004": 2})
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000005", orth_species_full_name=species,
+                                                             sister_species_data_fetcher=sister_df),
+                         ([["WBGene10000003", "Cbr-gene-3"]], "Caenorhabditis briggsae"))
+        sister_df = SisterSpeciesDataManagerStub({"WBGene10000001": 10})
+        self.assertEqual(self.df.get_best_orthologs_for_gene("WB:WBGene00000004", orth_species_full_name=species,
+                                                             sister_species_data_fetcher=sister_df),
+                         ([["WBGene10000001", "Cbr-gene-1"]], "Caenorhabditis briggsae"))
+
+    def _get_data_manager_with_local_files(self):
+        # do not download the GO slim, so that only local files are loaded
+        self.conf_parser.config["go_sentences_options"]["slim_url"] = ""
+        df = WBDataManager(do_relations=None, go_relations=["subClassOf", "BFO:0000050"], config=self.conf_parser,
+                           species="c_elegans")
+        df.gene_data_url = "file://" + os.path.join(self.this_dir, os.pardir, "data",
+                                                    "c_elegans.PRJNA13758.WS273.geneIDs.txt.gz")
+        df.gene_data_cache_path = os.path.join(self.this_dir, "cache", "c_elegans.PRJNA13758.WS273.geneIDs.txt.gz")
+        df.go_ontology_url = "file://" + os.path.join(self.this_dir, os.pardir, "data", "go_gd_test.obo")
+        df.go_ontology_cache_path = os.path.join(self.this_dir, "cache", "go_gd_test.obo")
+        df.go_associations_url = "file://" + os.path.join(self.this_dir, os.pardir, "data",
+                                                          "gene_association_1.7.wb.partial")
+        df.go_associations_cache_path = os.path.join(self.this_dir, "cache", "gene_association_1.7.wb.partial")
+        df.orthology_url = "file://" + os.path.join(self.this_dir, "data", "c_elegans.orthologs_test.txt")
+        df.orthology_cache_path = os.path.join(self.this_dir, "cache", "c_elegans.orthologs_test.txt")
+        df.protein_domain_url = "file://" + os.path.join(self.this_dir, "data", "c_elegans.protein_domains_test.csv")
+        df.protein_domain_cache_path = os.path.join(self.this_dir, "cache", "c_elegans.protein_domains_test.csv")
+        return df
+
+    def test_load_all_data_for_selected_modules(self):
+        df = self._get_data_manager_with_local_files()
+        df.load_all_data_from_file(modules={Module.GO})
+        self.assertEqual(df.fetched_cache_paths, {df.gene_data_cache_path, df.go_ontology_cache_path,
+                                                  df.go_associations_cache_path})
+        self.assertTrue(len(df.gene_data) > 0)
+        self.assertTrue(df.go_ontology is not None)
+        self.assertTrue(df.go_associations is not None)
+        self.assertTrue(df.do_ontology is None)
+        self.assertTrue(df.do_associations is None)
+        self.assertTrue(df.expression_ontology is None)
+        self.assertTrue(df.expression_associations is None)
+        self.assertFalse(df.expression_cluster_anatomy_data)
+        self.assertFalse(df.expression_cluster_molreg_data)
+        self.assertFalse(df.expression_cluster_genereg_data)
+        self.assertEqual(df.orthologs, {})
+        self.assertEqual(df.protein_domains, {})
+
+    def test_load_all_data_for_information_poor_module(self):
+        df = self._get_data_manager_with_local_files()
+        df.load_all_data_from_file(modules={Module.INFO_POOR})
+        self.assertEqual(df.fetched_cache_paths, {df.gene_data_cache_path, df.go_ontology_cache_path,
+                                                  df.go_associations_cache_path, df.orthology_cache_path,
+                                                  df.protein_domain_cache_path})
+        self.assertTrue(df.go_associations is not None)
+        self.assertTrue(df.do_associations is None)
+        self.assertTrue(df.expression_associations is None)
+        self.assertTrue("WB:WBGene00000001" in df.orthologs)
+        self.assertEqual(df.protein_domains["WBGene00000002"], [["IPR002293", "Amino acid/polyamine transporter I"]])
@@ -1,17 +1,52 @@
+import csv
 import logging
 import os
 import re
+import sys
 
 from collections import defaultdict
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Iterable
 from ontobio import AssociationSetFactory
-from genedescriptions.commons import DataType, Gene, Module
+from genedescriptions.commons import DataType, Gene, Module, cached_property
 from genedescriptions.config_parser import GenedescConfigParser, ConfigModuleProperty
 from genedescriptions.data_manager import ExpressionClusterFeature, DataManager, ExpressionClusterType
 
 
 logger = logging.getLogger(__name__)
 
+PREFETCH_MAX_WORKERS = 8
+
+# shared by all the expression annotations whose qualifiers are rewritten as verified. Treat as read-only
+_VERIFIED_QUALIFIERS = ["Verified"]
+
+# modules that need each of the optional data types loaded by load_all_data_from_file. Expression clusters are
+# loaded with the expression data, since anatomy clusters add enrichment annotations to the expression associations
+_GO_MODULES = frozenset({Module.GO, Module.GO_FUNCTION, Module.GO_PROCESS, Module.GO_COMPONENT, Module.INFO_POOR})
+_DO_MODULES = frozenset({Module.DO_EXPERIMENTAL, Module.DO_BIOMARKER, Module.DO_ORTHOLOGY})
+_EXPRESSION_MODULES = frozenset({Module.EXPRESSION, Module.EXPRESSION_CLUSTER_GENE, Module.EXPRESSION_CLUSTER_ANATOMY,
+                                 Module.EXPRESSION_CLUSTER_MOLECULE, Module.EXPRESSION_CLUSTER_GENEREG})
+_ORTHOLOGY_MODULES = frozenset({Module.ORTHOLOGY, Module.INFO_POOR, Module.INFO_POOR_HUMAN_FUNCTION, Module.SISTER_SP})
+_PROTEIN_DOMAIN_MODULES = frozenset({Module.PROTEIN_DOMAIN, Module.INFO_POOR})
+
+# non-comment daf rows whose object type (second column) is gene
+_DAF_GENE_ROW_REGEX = re.compile(r"(?!\s*!)[^\t]*\tgene\t")
+
+
+def _read_lines(file_path: str) -> List[str]:
+    """read a whole text file at once and return its lines without line terminators
+
+    Args:
+        file_path (str): path to the file to read
+    Returns:
+        List[str]: the lines of the file
+    """
+    with open(file_path) as file:
+        lines = file.read().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
 
 class WBDataManager(DataManager):
     """data fetcher for WormBase raw files for a single species"""
@@ -40,79 +75,124 @@ class WBDataManager(DataManager):
                                                           organisms_info[species]["ortholog"]]):
             self.orth_fullnames = [organisms_info[ortholog_sp]["full_name"] for ortholog_sp in
                                    organisms_info[species]["ortholog"]]
-        expression_cluster_anatomy_prefix = organisms_info[species]["ec_anatomy_prefix"] if \
-            "ec_anatomy_prefix" in organisms_info[species] else None
-        expression_cluster_molreg_prefix = organisms_info[species]["ec_molreg_prefix"] if \
-            "ec_molreg_prefix" in organisms_info[species] else None
-        expression_cluster_genereg_prefix = organisms_info[species]["ec_genereg_prefix"] if \
-            "ec_genereg_prefix" in organisms_info[species] else None
         super().__init__(go_relations=go_relations, do_relations=do_relations, use_cache=use_cache)
-        self.gene_data_cache_path = os.path.join(cache_location, "wormbase", release_version, "species", species,
-                                                 project_id, "annotation", species + '.' + project_id +
-                                                 '.' + release_version + ".geneIDs.txt.gz")
-        self.gene_data_url = raw_files_source + '/' + release_version + '/species/' + species + '/' + project_id + \
-                             '/annotation/' + species + '.' + project_id + '.' + release_version + '.geneIDs.txt.gz'
-        self.go_ontology_cache_path = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY",
-                                                   "gene_ontology." + release_version + ".obo")
-        self.go_ontology_url = raw_files_source + '/' + release_version + '/ONTOLOGY/gene_ontology.' + \
-                               release_version + '.obo'
-        self.go_associations_cache_path = os.path.join(cache_location, "wormbase", release_version,
-                                                       "ONTOLOGY/gene_association." + release_version + ".wb." +
-                                                       species)
-        self.go_associations_url = raw_files_source + '/' + release_version + '/ONTOLOGY/gene_association.' + \
-                                   release_version + '.wb.' + species
-        self.do_ontology_url = raw_files_source + '/' + release_version + '/ONTOLOGY/disease_ontology.' + \
-                               release_version + '.obo'
-        self.do_ontology_cache_path = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY",
-                                                   "disease_ontology." + release_version + ".obo")
-        self.do_associations_cache_path = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY",
-                                                       "disease_associations.by_orthology." + release_version +
-                                                       ".tsv.txt")
-        self.do_associations_url = raw_files_source + '/' + release_version + \
-                                   '/ONTOLOGY/disease_associations.by_orthology.' + release_version + '.tsv.txt'
-        self.do_associations_new_cache_path = os.path.join(cache_location, "wormbase", release_version, 'ONTOLOGY',
-                                                           'disease_association.' + release_version + '.daf.txt')
-        self.do_associations_new_url = raw_files_source + '/' + release_version + '/ONTOLOGY/disease_association.' + \
-                                       release_version + '.daf.txt'
-        self.orthology_url = raw_files_source + '/' + release_version + '/species/' + species + '/' + project_id + \
-                             '/annotation/' + species + '.' + project_id + '.' + release_version + '.orthologs.txt.gz'
-        self.orthology_cache_path = os.path.join(cache_location, "wormbase", release_version, "species", species,
-                                                 project_id, "annotation", species + '.' + project_id + '.' +
-                                                 release_version + ".orthologs.txt.gz")
-        self.orthologs = defaultdict(lambda: defaultdict(list))
-        self.protein_domain_url = raw_files_source + '/' + release_version + '/species/' + species + '/' + \
-                                  project_id + '/annotation/' + species + '.' + project_id + '.' + release_version + \
-                                  '.protein_domains.csv.gz'
-        self.protein_domain_cache_path = os.path.join(cache_location, "wormbase", release_version, "species", species,
-                                                      project_id, "annotation", species + '.' + project_id +
-                                                      '.' + release_version + ".protein_domains.csv.gz")
-        self.protein_domains = defaultdict(list)
-        self.expression_ontology_cache_path = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY",
-                                                           "anatomy_ontology." + release_version + ".obo")
-        self.expression_ontology_url = raw_files_source + '/' + release_version + '/ONTOLOGY/anatomy_ontology.' + \
-                                       release_version + '.obo'
-        self.expression_associations_cache_path = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY",
-                                                           "anatomy_association." + release_version + ".wb")
-        self.expression_associations_url = raw_files_source + '/' + release_version + \
-                                           '/ONTOLOGY/anatomy_association.' + release_version + '.wb'
-        self.expression_cluster_anatomy_url = self._get_expression_cluster_url(
-            prefix=expression_cluster_anatomy_prefix, ec_type="anatomy", release_version=release_version)
-        self.expression_cluster_anatomy_cache_path = self._get_expression_cluster_cache_path(
-            prefix=expression_cluster_anatomy_prefix, ec_type="anatomy", release_version=release_version,
-            cache_location=cache_location)
-        self.expression_cluster_anatomy_data = defaultdict(list) if self.expression_cluster_anatomy_url else None
-        self.expression_cluster_molreg_url = self._get_expression_cluster_url(
-            prefix=expression_cluster_molreg_prefix, ec_type="molReg", release_version=release_version)
-        self.expression_cluster_molreg_cache_path = self._get_expression_cluster_cache_path(
-            prefix=expression_cluster_molreg_prefix, ec_type="molReg", release_version=release_version,
-            cache_location=cache_location)
-        self.expression_cluster_molreg_data = defaultdict(list) if self.expression_cluster_molreg_url else None
-        self.expression_cluster_genereg_url = self._get_expression_cluster_url(
-            prefix=expression_cluster_genereg_prefix, ec_type="geneReg", release_version=release_version)
-        self.expression_cluster_genereg_cache_path = self._get_expression_cluster_cache_path(
-            prefix=expression_cluster_genereg_prefix, ec_type="geneReg", release_version=release_version,
-            cache_location=cache_location)
-        self.expression_cluster_genereg_data = defaultdict(list) if self.expression_cluster_genereg_url else None
+        self._organism_info = organisms_info[species]
+        self._cache_location = cache_location
+        self._release_version = release_version
+        self._species_annotation_dir = os.path.join(cache_location, "wormbase", release_version, "species", species,
+                                                    project_id, "annotation")
+        self._species_annotation_url = raw_files_source + '/' + release_version + '/species/' + species + '/' + \
+            project_id + '/annotation'
+        self._species_file_prefix = species + '.' + project_id + '.' + release_version
+        self._ontology_dir = os.path.join(cache_location, "wormbase", release_version, "ONTOLOGY")
+        self._ontology_url = raw_files_source + '/' + release_version + '/ONTOLOGY'
+        self.gene_data_cache_path = self._species_annotation_cache_path("geneIDs.txt.gz")
+        self.gene_data_url = self._species_annotation_file_url("geneIDs.txt.gz")
+        self.go_ontology_cache_path = self._ontology_cache_path("gene_ontology." + release_version + ".obo")
+        self.go_ontology_url = self._ontology_file_url("gene_ontology." + release_version + ".obo")
+        self.go_associations_cache_path = self._ontology_cache_path("gene_association." + release_version + ".wb." +
+                                                                    species)
+        self.go_associations_url = self._ontology_file_url("gene_association." + release_version + ".wb." + species)
+        self.do_ontology_cache_path = self._ontology_cache_path("disease_ontology." + release_version + ".obo")
+        self.do_ontology_url = self._ontology_file_url("disease_ontology." + release_version + ".obo")
+        self.do_associations_cache_path = self._ontology_cache_path("disease_associations.by_orthology." +
+                                                                    release_version + ".tsv.txt")
+        self.do_associations_url = self._ontology_file_url("disease_associations.by_orthology." + release_version +
+                                                           ".tsv.txt")
+        self.expression_ontology_cache_path = self._ontology_cache_path("anatomy_ontology." + release_version + ".obo")
+        self.expression_ontology_url = self._ontology_file_url("anatomy_ontology." + release_version + ".obo")
+        self.expression_associations_cache_path = self._ontology_cache_path("anatomy_association." + release_version +
+                                                                            ".wb")
+        self.expression_associations_url = self._ontology_file_url("anatomy_association." + release_version + ".wb")
+
+    def _ontology_cache_path(self, file_name: str) -> str:
+        return os.path.join(self._ontology_dir, file_name)
+
+    def _ontology_file_url(self, file_name: str) -> str:
+        return self._ontology_url + '/' + file_name
+
+    def _species_annotation_cache_path(self, file_suffix: str) -> str:
+        return os.path.join(self._species_annotation_dir, self._species_file_prefix + "." + file_suffix)
+
+    def _species_annotation_file_url(self, file_suffix: str) -> str:
+        return self._species_annotation_url + '/' + self._species_file_prefix + "." + file_suffix
+
+    @cached_property
+    def do_associations_new_cache_path(self):
+        return self._ontology_cache_path("disease_association." + self._release_version + ".daf.txt")
+
+    @cached_property
+    def do_associations_new_url(self):
+        return self._ontology_file_url("disease_association." + self._release_version + ".daf.txt")
+
+    @cached_property
+    def orthology_cache_path(self):
+        return self._species_annotation_cache_path("orthologs.txt.gz")
+
+    @cached_property
+    def orthology_url(self):
+        return self._species_annotation_file_url("orthologs.txt.gz")
+
+    @cached_property
+    def orthologs(self):
+        return {}
+
+    @cached_property
+    def protein_domain_cache_path(self):
+        return self._species_annotation_cache_path("protein_domains.csv.gz")
+
+    @cached_property
+    def protein_domain_url(self):
+        return self._species_annotation_file_url("protein_domains.csv.gz")
+
+    @cached_property
+    def protein_domains(self):
+        return {}
+
+    @cached_property
+    def expression_cluster_anatomy_cache_path(self):
+        return self._get_expression_cluster_cache_path(
+            prefix=self._organism_info.get("ec_anatomy_prefix"), ec_type="anatomy",
+            release_version=self._release_version, cache_location=self._cache_location)
+
+    @cached_property
+    def expression_cluster_anatomy_url(self):
+        return self._get_expression_cluster_url(prefix=self._organism_info.get("ec_anatomy_prefix"),
+                                                ec_type="anatomy", release_version=self._release_version)
+
+    @cached_property
+    def expression_cluster_anatomy_data(self):
+        return defaultdict(list) if self.expression_cluster_anatomy_url else None
+
+    @cached_property
+    def expression_cluster_molreg_cache_path(self):
+        return self._get_expression_cluster_cache_path(
+            prefix=self._organism_info.get("ec_molreg_prefix"), ec_type="molReg",
+            release_version=self._release_version, cache_location=self._cache_location)
+
+    @cached_property
+    def expression_cluster_molreg_url(self):
+        return self._get_expression_cluster_url(prefix=self._organism_info.get("ec_molreg_prefix"),
+                                                ec_type="molReg", release_version=self._release_version)
+
+    @cached_property
+    def expression_cluster_molreg_data(self):
+        return defaultdict(list) if self.expression_cluster_molreg_url else None
+
+    @cached_property
+    def expression_cluster_genereg_cache_path(self):
+        return self._get_expression_cluster_cache_path(
+            prefix=self._organism_info.get("ec_genereg_prefix"), ec_type="geneReg",
+            release_version=self._release_version, cache_location=self._cache_location)
+
+    @cached_property
+    def expression_cluster_genereg_url(self):
+        return self._get_expression_cluster_url(prefix=self._organism_info.get("ec_genereg_prefix"),
+                                                ec_type="geneReg", release_version=self._release_version)
+
+    @cached_property
+    def expression_cluster_genereg_data(self):
+        return defaultdict(list) if self.expression_cluster_genereg_url else None
 
     @staticmethod
     def _get_expression_cluster_url(prefix, ec_type, release_version):
@@ -135,14 +215,20 @@ class WBDataManager(DataManager):
         """load gene list from pre-set file location"""
         logger.info("Loading genes data from file")
         if not self.gene_data or len(self.gene_data.items()) == 0:
-            self.gene_data = {}
             file_path = self._get_cached_file(cache_path=self.gene_data_cache_path, file_source_url=self.gene_data_url)
-            with open(file_path) as file:
-                for line in file:
-                    fields = line.strip().split(',')
-                    if fields[1].startswith("WBGene"):
-                        name = fields[2] if fields[2] != '' else fields[3]
-                        self.gene_data["WB:" + fields[1]] = Gene("WB:" + fields[1], name, fields[4] == "Dead", False)
+            self.gene_data = self._load_or_parse(cache_path=self.gene_data_cache_path,
+                                                 parse_fn=lambda: self._parse_gene_data_file(file_path))
+
+    @staticmethod
+    def _parse_gene_data_file(file_path: str) -> Dict[str, Gene]:
+        gene_data = {}
+        for line in _read_lines(file_path):
+            # only the first five columns are used
+            fields = line.split(',', 5)
+            if fields[1].startswith("WBGene"):
+                gene_id = sys.intern("WB:" + fields[1])
+                gene_data[gene_id] = Gene(gene_id, fields[2] or fields[3], fields[4] == "Dead", False)
+        return gene_data
 
     def load_associations_from_file(self, associations_type: DataType, associations_url: str,
                                     associations_cache_path: str, config: GenedescConfigParser,
@@ -153,19 +239,11 @@ class WBDataManager(DataManager):
             super().load_associations_from_file(associations_type=associations_type, associations_url=associations_url,
                                                 associations_cache_path=associations_cache_path, config=config)
         elif associations_type == DataType.EXPR:
-            associations = []
             file_path = self._get_cached_file(cache_path=associations_cache_path, file_source_url=associations_url)
-            for line in open(file_path):
-                if not line.strip().startswith("!"):
-                    linearr = line.strip().split("\t")
-                    if self.expression_ontology.node(linearr[4]):
-                        gene_id = linearr[0] + ":" + linearr[1]
-                        qualifiers = linearr[3].split("|")
-                        if len(qualifiers) == 0 or "Partial" in qualifiers or "Certain" in qualifiers:
-                            qualifiers = ["Verified"]
-                        associations.append(DataManager.create_annotation_record(
-                            line, gene_id, linearr[2], linearr[11], linearr[12], linearr[4], qualifiers, linearr[8],
-                            linearr[6], linearr[5].split("|"), linearr[14], linearr[13]))
+            # the parsed associations are cached before filtering, so that a newer ontology is always applied
+            associations = [association for association in self._load_or_parse(
+                cache_path=associations_cache_path, parse_fn=lambda: self._parse_expression_associations(file_path))
+                if self.expression_ontology.node(association["object"]["id"])]
             self.expression_associations = AssociationSetFactory().create_from_assocs(assocs=associations,
                                                                                       ontology=self.expression_ontology)
             self.expression_associations = self.remove_blacklisted_annotations(
@@ -174,74 +252,112 @@ class WBDataManager(DataManager):
                                                            prop=ConfigModuleProperty.EXCLUDE_TERMS))
         elif associations_type == DataType.DO:
             file_path_wb = self._get_cached_file(cache_path=associations_cache_path, file_source_url=associations_url)
-            associations_wb = []
-            for line in open(file_path_wb):
-                if not line.strip().startswith("!"):
-                    linearr = line.strip().split("\t")
-                    if self.do_ontology.has_node(linearr[1]) and len(linearr[4].split("|")) > 1:
-                        associations_wb.append(DataManager.create_annotation_record(
-                            line, "WB:" + linearr[0], '', 'gene', '', linearr[1],
-                            "", "D", "IEA", "", "WB", ""))
-            self.do_associations = AssociationSetFactory().create_from_assocs(assocs=associations_wb,
-                                                                              ontology=self.do_ontology)
+            # all the by_orthology associations are IEA, so the daf associations are appended to them and the
+            # association set is built once
+            associations = self._load_or_parse(cache_path=associations_cache_path,
+                                               parse_fn=lambda: self._parse_do_orthology_associations(file_path_wb))
             if association_additional_cache_path and association_additional_url:
-                associations = []
-                for subj_associations in self.do_associations.associations_by_subj.values():
-                    for association in subj_associations:
-                        if association["evidence"]["type"] == "IEA":
-                            associations.append(association)
                 file_path = self._get_cached_file(cache_path=association_additional_cache_path,
                                                   file_source_url=association_additional_url)
-                header = True
-                for line in open(file_path):
-                    if not line.strip().startswith("!"):
-                        if not header:
-                            linearr = line.strip().split("\t")
-                            if self.do_ontology.has_node(linearr[10]) and "IEA" not in linearr[16] and \
-                                linearr[1] == "gene":
-                                gene_ids = ["WB:" + linearr[3]]
-                                if linearr[1] == "allele":
-                                    gene_ids = linearr[4].split(",")
-                                if linearr[8] == "is_marker_for":
-                                    linearr[16] = "BMK"
-                                elif linearr[8] == "is_implicated_in" or linearr[8] == "is_model_of":
-                                    linearr[16] = "IMP"
-                                for gene_id in gene_ids:
-                                    associations.append(DataManager.create_annotation_record(
-                                        line, gene_id, linearr[3], linearr[1], linearr[0], linearr[10],
-                                        linearr[9].split("|"), "D", linearr[16], linearr[18].split("|"),
-                                        linearr[20], linearr[19]))
-                        else:
-                            header = False
-                self.do_associations = AssociationSetFactory().create_from_assocs(assocs=associations,
-                                                                                  ontology=self.do_ontology)
+                associations.extend(self._load_or_parse(
+                    cache_path=association_additional_cache_path,
+                    parse_fn=lambda: self._parse_do_daf_associations(file_path)))
+            # filtered after loading for the same reason as the expression associations
+            do_term_ids = frozenset(self.do_ontology.nodes())
+            associations = [association for association in associations if
+                            association["object"]["id"] in do_term_ids]
+            self.do_associations = AssociationSetFactory().create_from_assocs(assocs=associations,
+                                                                              ontology=self.do_ontology)
             self.do_associations = self.remove_blacklisted_annotations(
                 association_set=self.do_associations, ontology=self.do_ontology,
                 terms_blacklist=config.get_module_property(module=Module.DO_EXPERIMENTAL,
                                                            prop=ConfigModuleProperty.EXCLUDE_TERMS))
 
+    @staticmethod
+    def _parse_expression_associations(file_path: str) -> List[Dict]:
+        associations = []
+        with open(file_path, newline='') as file:
+            for linearr in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+                if linearr and not linearr[0].startswith("!"):
+                    gene_id = linearr[0] + ":" + linearr[1]
+                    qualifiers = linearr[3].split("|")
+                    if not qualifiers or "Partial" in qualifiers or "Certain" in qualifiers:
+                        qualifiers = _VERIFIED_QUALIFIERS
+                    associations.append(DataManager.create_annotation_record(
+                        "\t".join(linearr), gene_id, linearr[2], sys.intern(linearr[11]), sys.intern(linearr[12]),
+                        sys.intern(linearr[4]), qualifiers, sys.intern(linearr[8]), sys.intern(linearr[6]),
+                        linearr[5].split("|"), sys.intern(linearr[14]), linearr[13]))
+        return associations
+
+    @staticmethod
+    def _parse_do_orthology_associations(file_path: str) -> List[Dict]:
+        associations = []
+        for line in _read_lines(file_path):
+            if not line.startswith("!"):
+                linearr = line.strip().split("\t")
+                if "|" in linearr[4]:
+                    associations.append(DataManager.create_annotation_record(
+                        line, "WB:" + linearr[0], '', 'gene', '', sys.intern(linearr[1]),
+                        "", "D", "IEA", "", "WB", ""))
+        return associations
+
+    @staticmethod
+    def _parse_do_daf_associations(file_path: str) -> List[Dict]:
+        associations = []
+        header = True
+        for line in _read_lines(file_path):
+            if header:
+                if not line.lstrip().startswith("!"):
+                    header = False
+                continue
+            # most rows describe alleles, strains or transgenes and are discarded without being split
+            if not _DAF_GENE_ROW_REGEX.match(line):
+                continue
+            linearr = line.split("\t")
+            if "IEA" not in linearr[16]:
+                if linearr[8] == "is_marker_for":
+                    linearr[16] = "BMK"
+                elif linearr[8] == "is_implicated_in" or linearr[8] == "is_model_of":
+                    linearr[16] = "IMP"
+                associations.append(DataManager.create_annotation_record(
+                    line, "WB:" + linearr[3], linearr[3], linearr[1], sys.intern(linearr[0]),
+                    sys.intern(linearr[10]), linearr[9].split("|"), "D", sys.intern(linearr[16]),
+                    linearr[18].split("|"), sys.intern(linearr[20]), linearr[19]))
+        return associations
+
     def load_orthology_from_file(self):
         logger.info("Loading orthology from file")
         orthology_file = self._get_cached_file(cache_path=self.orthology_cache_path,
                                                file_source_url=self.orthology_url)
-        orthologs = defaultdict(list)
+        self.orthologs.update(self._load_or_parse(cache_path=self.orthology_cache_path,
+                                                  parse_fn=lambda: self._parse_orthology_file(orthology_file)))
+
+    @staticmethod
+    def _parse_orthology_file(file_path: str) -> Dict[str, Dict[str, List[Tuple[str, str, int]]]]:
+        genes_orthologs = {}
+        orthologs = {}
         gene_id = ""
         header = True
-        for line in open(orthology_file):
+        for line in _read_lines(file_path):
             if not line.startswith("#"):
-                if line.strip() == "=":
+                line = line.strip()
+                if line == "=":
                     header = True
-                    self.orthologs["WB:" + gene_id] = orthologs
-                    orthologs = defaultdict(list)
+                    genes_orthologs[sys.intern("WB:" + gene_id)] = orthologs
+                    orthologs = {}
                 elif header:
-                    gene_id = line.strip().split()[0]
+                    gene_id = line.split()[0]
                     header = False
                 else:
-                    ortholog_arr = line.strip().split("\t")
+                    ortholog_arr = line.split("\t")
                     if not ortholog_arr[1].startswith("PRJEB28388") and (not ortholog_arr[1].startswith("PRJNA13758") or
                                                                          len(ortholog_arr) > 3 and
-                                                                         len(ortholog_arr[3].split(";")) > 2):
-                        orthologs[ortholog_arr[0]].append(ortholog_arr[1:4])
+                                                                         ortholog_arr[3].count(";") > 1):
+                        # ortholog id, ortholog name and number of methods that predicted the orthology
+                        orthologs.setdefault(sys.intern(ortholog_arr[0]), []).append((
+                            ortholog_arr[1], ortholog_arr[2],
+                            ortholog_arr[3].count(";") + 1 if len(ortholog_arr) > 3 else 0))
+        return genes_orthologs
 
     def get_best_orthologs_for_gene(self, gene_id: str, orth_species_full_name: List[str],
                                     sister_species_data_fetcher: DataManager = None,
@@ -266,31 +382,30 @@ class WBDataManager(DataManager):
         logger.info("Getting list of best orthologs for gene")
         best_orthologs = None
         curr_orth_fullname = None
+        gene_orthologs = self.orthologs.get(gene_id, {})
         if len(orth_species_full_name) > 0:
             for curr_orth_fullname in orth_species_full_name:
-                if curr_orth_fullname in self.orthologs[gene_id]:
-                    orthologs = self.orthologs[gene_id][curr_orth_fullname]
+                if curr_orth_fullname in gene_orthologs:
+                    orthologs = gene_orthologs[curr_orth_fullname]
                     # for human orthologs, take only those predicted by more than 1 method - removed
                     # if len(orth_species_full_name) == 1 and orth_species_full_name[0] == "Homo sapiens":
                     #     orthologs = [ortholog for ortholog in orthologs if len(ortholog[2].split(";")) > 1]
-                    orthologs_keys = []
                     if len(orthologs) > 0:
                         if len(orthologs) > 1:
+                            best_score = None
                             for ortholog in orthologs:
+                                score = ortholog[2]
                                 if sister_species_data_fetcher:
-                                    orthologs_keys.append([ortholog[0], ortholog[1], len(ortholog[2].split(";")),
-                                                           len(sister_species_data_fetcher.get_annotations_for_gene(
-                                                               gene_id=ortholog[0], annot_type=DataType.GO,
-                                                               priority_list=ecode_priority_list))])
-                                else:
-                                    orthologs_keys.append([ortholog[0], ortholog[1], len(ortholog[2].split(";"))])
-                            if sister_species_data_fetcher:
-                                best_orthologs = [sorted(orthologs_keys, key=lambda x: (x[2], x[3]),
-                                                         reverse=True)[0][0:2]]
-                            else:
-                                best_orthologs = [[orth_key[0], orth_key[1]] for orth_key in
-                                                  sorted(orthologs_keys, key=lambda x: x[2], reverse=True) if
-                                                  orth_key[2] == max([orth[2] for orth in orthologs_keys])]
+                                    score = (score, len(sister_species_data_fetcher.get_annotations_for_gene(
+                                        gene_id=ortholog[0], annot_type=DataType.GO,
+                                        priority_list=ecode_priority_list)))
+                                # keep the first ortholog with the highest score, or all the tied ones when not
+                                # ranking by sister species annotations
+                                if best_score is None or score > best_score:
+                                    best_score = score
+                                    best_orthologs = [[ortholog[0], ortholog[1]]]
+                                elif score == best_score and not sister_species_data_fetcher:
+                                    best_orthologs.append([ortholog[0], ortholog[1]])
                         else:
                             best_orthologs = [[orthologs[0][0], orthologs[0][1]]]
                         break
@@ -301,11 +416,22 @@ class WBDataManager(DataManager):
         logger.info("Loading protein domain information from file")
         protein_domain_file = self._get_cached_file(cache_path=self.protein_domain_cache_path,
                                                     file_source_url=self.protein_domain_url)
-        for line in open(protein_domain_file):
+        self.protein_domains.update(self._load_or_parse(
+            cache_path=self.protein_domain_cache_path,
+            parse_fn=lambda: self._parse_protein_domain_file(protein_domain_file)))
+
+    @staticmethod
+    def _parse_protein_domain_file(file_path: str) -> Dict[str, List[List[str]]]:
+        protein_domains = {}
+        for line in _read_lines(file_path):
             linearr = line.strip().split("\t")
             if len(linearr) > 3 and linearr[3] != "":
-                self.protein_domains[linearr[0]] = [domain[0:-1].split(" \"") if len(domain[0:-1].split(" \"")) > 1 else
-                                                    [domain, ""] for domain in linearr[3:]]
+                domains = []
+                for domain in linearr[3:]:
+                    domain_arr = domain[0:-1].split(" \"")
+                    domains.append(domain_arr if len(domain_arr) > 1 else [domain, ""])
+                protein_domains[linearr[0]] = domains
+        return protein_domains
 
     @staticmethod
     def get_replaced_terms_arr(terms, terms_replacement_regex):
@@ -320,7 +446,6 @@ class WBDataManager(DataManager):
     def _load_expression_cluster_file(self, file_cache_path, file_url, load_into_data,
                                       add_to_expression_ontology_annotations: bool = False):
         expr_clust_file = self._get_cached_file(cache_path=file_cache_path, file_source_url=file_url)
-        header = True
         associations = []
         terms_ids_map = {}
         if add_to_expression_ontology_annotations:
@@ -329,33 +454,47 @@ class WBDataManager(DataManager):
                             subj_associations]
         terms_replacement_regex = self.config.get_module_property(module=Module.EXPRESSION,
                                                                   prop=ConfigModuleProperty.RENAME_TERMS)
-        for line in open(expr_clust_file):
-            if not header:
-                linearr = line.strip().split("\t")
-                load_into_data[linearr[0]] = linearr[1:]
-                load_into_data[linearr[0]][2] = WBDataManager.get_replaced_terms_arr(
-                    load_into_data[linearr[0]][2].split(","), terms_replacement_regex)
-                if load_into_data[linearr[0]] and load_into_data[linearr[0]][3]:
-                    load_into_data[linearr[0]][3] = [word.replace(" study", "").replace(" analysis", "") for word in
-                                                     load_into_data[linearr[0]][3].split(",")]
-                if add_to_expression_ontology_annotations:
-                    for term in load_into_data[linearr[0]][2]:
-                        if term not in terms_ids_map:
-                            term_ids = self.expression_ontology.resolve_names([term])
-                            if term_ids:
-                                terms_ids_map[term] = term_ids[0]
-                            else:
-                                terms_ids_map[term] = None
-                        if term in terms_ids_map and terms_ids_map[term]:
-                            associations.append(DataManager.create_annotation_record(
-                                line, "WB:" + linearr[0], "", "gene", "", terms_ids_map[term], ["Enriched"], "A", "IDA",
-                                "", "", ""))
-            else:
-                header = False
+        terms_replacement_regex = {re.compile(regex_to_substitute): regex_target for regex_to_substitute, regex_target
+                                   in terms_replacement_regex.items()}
+        renamed_terms = {}
+        # term renaming depends on the configuration, so it is applied after loading the parsed file
+        for source_line, gene_id, cluster_data in self._load_or_parse(
+                cache_path=file_cache_path, parse_fn=lambda: self._parse_expression_cluster_file(expr_clust_file)):
+            for term in cluster_data[2]:
+                if term not in renamed_terms:
+                    renamed_terms[term] = WBDataManager.get_replaced_terms_arr([term], terms_replacement_regex)[0]
+            cluster_data[2] = [renamed_terms[term] for term in cluster_data[2]]
+            load_into_data[gene_id] = cluster_data
+            if add_to_expression_ontology_annotations:
+                for term in cluster_data[2]:
+                    if term not in terms_ids_map:
+                        term_ids = self.expression_ontology.resolve_names([term])
+                        terms_ids_map[term] = term_ids[0] if term_ids else None
+                    if terms_ids_map[term]:
+                        associations.append(DataManager.create_annotation_record(
+                            source_line, "WB:" + gene_id, "", "gene", "", terms_ids_map[term], ["Enriched"], "A",
+                            "IDA", "", "", ""))
         if add_to_expression_ontology_annotations:
             self.set_associations(DataType.EXPR, associations=AssociationSetFactory().create_from_assocs(
                 assocs=associations, ontology=self.expression_ontology), config=self.config)
 
+    @staticmethod
+    def _parse_expression_cluster_file(file_path: str) -> List[Tuple[str, str, List]]:
+        clusters = []
+        header = True
+        with open(file_path, newline='') as file:
+            for linearr in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+                if header:
+                    header = False
+                    continue
+                cluster_data = linearr[1:]
+                cluster_data[2] = cluster_data[2].split(",")
+                if cluster_data[3]:
+                    cluster_data[3] = [word.replace(" study", "").replace(" analysis", "") for word in
+                                       cluster_data[3].split(",")]
+                clusters.append(("\t".join(linearr), linearr[0], cluster_data))
+        return clusters
+
     def load_expression_cluster_data(self):
         """load all expression cluster data"""
         logger.info("Loading expression cluster data from file")
@@ -400,26 +539,75 @@ class WBDataManager(DataManager):
             return target[gene_id][idx]
         return None
 
-    def load_all_data_from_file(self) -> None:
-        """load all data types from pre-set file locations"""
+    def _prefetch_files(self, files: List[Tuple[str, str]]) -> None:
+        """download the given source files in parallel, so that the loaders find them in cache
+
+        Args:
+            files (List[Tuple[str, str]]): list of (cache path, url) pairs. Pairs with empty values are skipped
+        """
+        logger.info("Prefetching source files")
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as executor:
+            list(executor.map(lambda file: self._fetch_file(cache_path=file[0], file_source_url=file[1]),
+                              [file for file in files if file[0] and file[1]]))
+
+    def load_all_data_from_file(self, modules: Iterable[Module] = None) -> None:
+        """load all data types from pre-set file locations
+
+        Args:
+            modules (Iterable[Module]): if provided, only the data needed to generate descriptions for these modules
+                is loaded. Gene data is always loaded
+        """
+        modules = set(modules) if modules is not None else set(Module)
+        load_go = not modules.isdisjoint(_GO_MODULES)
+        load_do = not modules.isdisjoint(_DO_MODULES)
+        load_expression = not modules.isdisjoint(_EXPRESSION_MODULES)
+        load_orthology = not modules.isdisjoint(_ORTHOLOGY_MODULES)
+        load_protein_domains = not modules.isdisjoint(_PROTEIN_DOMAIN_MODULES)
+        files = [(self.gene_data_cache_path, self.gene_data_url)]
+        if load_go:
+            files.extend([(self.go_ontology_cache_path, self.go_ontology_url),
+                          (self.go_associations_cache_path, self.go_associations_url)])
+        if load_do:
+            files.extend([(self.do_ontology_cache_path, self.do_ontology_url),
+                          (self.do_associations_cache_path, self.do_associations_url),
+                          (self.do_associations_new_cache_path, self.do_associations_new_url)])
+        if load_expression:
+            files.extend([(self.expression_ontology_cache_path, self.expression_ontology_url),
+                          (self.expression_associations_cache_path, self.expression_associations_url),
+                          (self.expression_cluster_anatomy_cache_path, self.expression_cluster_anatomy_url),
+                          (self.expression_cluster_molreg_cache_path, self.expression_cluster_molreg_url),
+                          (self.expression_cluster_genereg_cache_path, self.expression_cluster_genereg_url)])
+        if load_orthology:
+            files.append((self.orthology_cache_path, self.orthology_url))
+        if load_protein_domains:
+            files.append((self.protein_domain_cache_path, self.protein_domain_url))
+        self._prefetch_files(files)
         self.load_gene_data_from_file()
-        self.load_ontology_from_file(ontology_type=DataType.GO, ontology_url=self.go_ontology_url,
-                                     ontology_cache_path=self.go_ontology_cache_path,
-                                     config=self.config)
-        self.load_associations_from_file(associations_type=DataType.GO, associations_url=self.go_associations_url,
-                                         associations_cache_path=self.go_associations_cache_path, config=self.config)
-        self.load_ontology_from_file(ontology_type=DataType.DO, ontology_url=self.do_ontology_url,
-                                     ontology_cache_path=self.do_ontology_cache_path, config=self.config)
-        self.load_associations_from_file(associations_type=DataType.DO, associations_url=self.do_associations_url,
-                                         associations_cache_path=self.do_associations_cache_path,
-                                         association_additional_cache_path=self.do_associations_new_cache_path,
-                                         association_additional_url=self.do_associations_new_url, config=self.config)
-        self.load_ontology_from_file(ontology_type=DataType.EXPR, ontology_url=self.expression_ontology_url,
-                                     ontology_cache_path=self.expression_ontology_cache_path, config=self.config)
-        self.load_associations_from_file(associations_type=DataType.EXPR,
-                                         associations_url=self.expression_associations_url,
-                                         associations_cache_path=self.expression_associations_cache_path,
+        if load_go:
+            self.load_ontology_from_file(ontology_type=DataType.GO, ontology_url=self.go_ontology_url,
+                                         ontology_cache_path=self.go_ontology_cache_path,
                                          config=self.config)
-        self.load_orthology_from_file()
-        self.load_expression_cluster_data()
-        self.load_protein_domain_information()
+            self.load_associations_from_file(associations_type=DataType.GO, associations_url=self.go_associations_url,
+                                             associations_cache_path=self.go_associations_cache_path,
+                                             config=self.config)
+        if load_do:
+            self.load_ontology_from_file(ontology_type=DataType.DO, ontology_url=self.do_ontology_url,
+                                         ontology_cache_path=self.do_ontology_cache_path, config=self.config)
+            self.load_associations_from_file(associations_type=DataType.DO, associations_url=self.do_associations_url,
+                                             associations_cache_path=self.do_associations_cache_path,
+                                             association_additional_cache_path=self.do_associations_new_cache_path,
+                                             association_additional_url=self.do_associations_new_url,
+                                             config=self.config)
+        if load_expression:
+            self.load_ontology_from_file(ontology_type=DataType.EXPR, ontology_url=self.expression_ontology_url,
+                                         ontology_cache_path=self.expression_ontology_cache_path, config=self.config)
+            self.load_associations_from_file(associations_type=DataType.EXPR,
+                                             associations_url=self.expression_associations_url,
+                                             associations_cache_path=self.expression_associations_cache_path,
+                                             config=self.config)
+        if load_orthology:
+            self.load_orthology_from_file()
+        if load_expression:
+            self.load_expression_cluster_data()
+        if load_protein_domains:
+            self.load_protein_domain_information()
@@ -134,9 +134,9 @@ def set_expression_cluster_sentence(dm: WBDataManager, conf_parser: GenedescConf
     if ec_genereg_terms:
         several_word = ""
         if len(ec_genereg_terms) > 3:
-            t_p = [t_p for t_p in sorted([[term, api_manager.get_textpresso_popularity(term)] for
-                                          term in ec_genereg_terms], key=lambda x: (x[1], x[0][1]),
-                                         reverse=True)]
+            t_p = [t_p for t_p in sorted([[term, popularity] for term, popularity in zip(
+                ec_genereg_terms, api_manager.get_textpresso_popularities(ec_genereg_terms))],
+                                         key=lambda x: (x[1], x[0][1]), reverse=True)]
             ec_genereg_terms = [term for term, popularity in t_p[0:3]]
             several_word = "several genes including "
         gene_desc.set_or_extend_module_description_and_final_stats(
@@ -189,7 +189,7 @@ def set_information_poor_sentence(orth_fullnames: List[str], selected_orthologs,
                                                                             best_orth] + " " + human_func_sent)
 
 
-    protein_domains = dm.protein_domains[gene_desc.gene_id[3:]]
+    protein_domains = dm.protein_domains.get(gene_desc.gene_id[3:], [])
     if protein_domains:
         dom_word = "domain"
         if len([ptdom[1] for ptdom in protein_domains if ptdom[1] != ""]) > 1:
@@ -246,7 +246,7 @@ def main():
     human_genes_props = DataManager.get_human_gene_props()
     api_manager = APIManager(textpresso_api_token=args.textpresso_token)
     for organism in organisms_list:
-        logger.info("Processing organism " + organism)
+        logger.info("Processing organism %s", organism)
         species = conf_parser.get_wb_organisms_info()
         dm, sister_df, df_agr = load_data(organism=organism, conf_parser=conf_parser)
         desc_writer = DescriptionsWriter()
@@ -255,7 +255,7 @@ def main():
             int(conf_parser.get_wb_release()[-1]) + 1)
         desc_writer.overall_properties.date = datetime.date.today().strftime("%B %d, %Y")
         for gene in dm.get_gene_data():
-            logger.debug("Generating description for gene " + gene.name)
+            logger.debug("Generating description for gene %s", gene.name)
             gene_desc = GeneDescription(gene_id=gene.id, config=conf_parser, gene_name=gene.name, add_gene_name=False)
             selected_orthologs, orth_sent = get_best_orthologs_and_sentence(
                 dm=dm, orth_fullnames=dm.orth_fullnames, human_genes_props=human_genes_props, gene_desc=gene_desc,
@@ -280,7 +280,7 @@ def main():
                                             species=species, organism=organism, gene_desc=gene_desc,
                                             conf_parser=conf_parser, gene=gene)
             desc_writer.add_gene_desc(gene_desc)
-        logger.info("All genes processed for " + organism)
+        logger.info("All genes processed for %s", organism)
         date_prefix = datetime.date.today().strftime("%Y%m%d")
         if "json" in args.output_formats:
             logger.info("Writing descriptions to json")